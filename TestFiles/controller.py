@@ -1,18 +1,24 @@
 import os
 import sys
 import time
+import random
+import socket
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import WebDriverException
 import subprocess
-import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Environment variables
 CHROME_NODE_SERVICE = os.getenv("CHROME_NODE_SERVICE", "http://chrome-node-service:4444")
-MAX_RETRIES = 5
-RETRY_DELAY = 10  # seconds
+NODE_COUNT = os.getenv("NODE_COUNT")  # Grid'deki Chrome Node sayısı (her biri tek session)
+MAX_RETRIES = 8
+BASE_DELAY = 0.5  # seconds
+MAX_DELAY = 10  # seconds
+RESULTS_FILE = "test_results.json"
 
 class TestController:
     """
@@ -28,60 +34,121 @@ class TestController:
         self.chrome_node_url = CHROME_NODE_SERVICE
         self.test_features_path = "features"
         self.drivers = []
+
+        # Health check istekleri için keep-alive bağlantı havuzu
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
+    def retry_delay(self, attempt):
+        """
+        Exponential backoff + jitter ile bir sonraki deneme öncesi bekleme süresi
+        Jitter, birden fazla controller'ın Grid'e aynı anda istek atmasını önler
+        """
+        return min(MAX_DELAY, BASE_DELAY * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+    def is_unrecoverable_error(self, error):
+        """
+        Tekrar denemekle düzelmeyecek bağlantı hatalarını ayırt eder (DNS NXDOMAIN)
+        Timeout, connection refused vb. geçici hatalar False döner
+        """
+        seen = set()
+        pending = [error]
+        while pending:
+            current = pending.pop()
+            if current is None or id(current) in seen:
+                continue
+            seen.add(id(current))
+
+            if isinstance(current, socket.gaierror) and current.errno == socket.EAI_NONAME:
+                return True
+
+            # requests/urllib3 asıl hatayı args, reason ve exception zinciri içinde saklar
+            pending.extend([current.__cause__, current.__context__, getattr(current, "reason", None)])
+            pending.extend(arg for arg in current.args if isinstance(arg, BaseException))
+
+        return False
+
     def check_chrome_node_health(self):
         """
         Chrome Node Pod'ların hazır olup olmadığını kontrol eder
         Selenium Grid'in /status endpoint'ini kullanır
         """
         print(f"🔍 Checking Chrome Node health at: {self.chrome_node_url}")
-        
+
+        # Selenium Grid status endpoint
+        status_url = f"{self.chrome_node_url}/wd/hub/status"
+
         for attempt in range(MAX_RETRIES):
             try:
-                # Selenium Grid status endpoint
-                status_url = f"{self.chrome_node_url}/wd/hub/status"
-                response = requests.get(status_url, timeout=5)
-                
+                response = self.session.get(status_url, timeout=(2, 5))
+            except requests.exceptions.RequestException as e:
+                if self.is_unrecoverable_error(e):
+                    print(f"Chrome Node host cannot be resolved: {e}")
+                    return False
+                print(f"⚠️  Connection failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
+            else:
                 if response.status_code == 200:
-                    data = response.json()
-                    
+                    # Ham bytes doğrudan orjson ile parse edilir (str decode yok)
+                    try:
+                        data = orjson.loads(response.content)
+                    except orjson.JSONDecodeError:
+                        # Başlangıçta proxy/ingress HTML sayfası dönebilir - tekrar dene
+                        data = None
+
+                    value = data.get("value") if isinstance(data, dict) else None
+                    if not isinstance(value, dict):
+                        # JSON değil ya da beklenen obje değil (null, [] vb.) - tekrar dene
+                        print(f"⚠️  Invalid status response (attempt {attempt + 1}/{MAX_RETRIES})")
                     # Grid'in ready olup olmadığını kontrol et
-                    if data.get("value", {}).get("ready", False):
+                    elif value.get("ready", False):
                         print("✅ Chrome Node is ready!")
                         return True
                     else:
                         print(f"⏳ Chrome Node not ready yet (attempt {attempt + 1}/{MAX_RETRIES})")
-                        
-            except requests.exceptions.RequestException as e:
-                print(f"⚠️  Connection failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-            
+                elif response.status_code == 404:
+                    # Yanlış URL - tekrar denemek sonucu değiştirmez
+                    print(f"Status endpoint not found: {status_url}")
+                    return False
+                else:
+                    print(f"⚠️  Unexpected status {response.status_code} (attempt {attempt + 1}/{MAX_RETRIES})")
+
             if attempt < MAX_RETRIES - 1:
-                print(f"⏰ Waiting {RETRY_DELAY} seconds before retry...")
-                time.sleep(RETRY_DELAY)
-        
+                delay = self.retry_delay(attempt)
+                print(f"⏰ Waiting {delay:.1f} seconds before retry...")
+                time.sleep(delay)
+
         print("Chrome Node is not available after max retries")
         return False
     
     def collect_test_features(self):
         """
         Behave feature dosyalarını toplar
+        os.scandir ile iteratif gezinir; entry başına ek stat() ve Path objesi oluşturmaz
         """
         print(f"Collecting test features from: {self.test_features_path}")
         
-        features_path = Path(self.test_features_path)
-        
-        if not features_path.exists():
-            print(f"Features directory not found: {features_path}")
+        if not os.path.isdir(self.test_features_path):
+            print(f"Features directory not found: {self.test_features_path}")
             return []
         
         # Tüm .feature dosyalarını bul
-        feature_files = list(features_path.glob("**/*.feature"))
+        feature_files = []
+        stack = [self.test_features_path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".feature"):
+                        feature_files.append(entry.path)
         
         print(f"Found {len(feature_files)} feature file(s):")
         for feature in feature_files:
-            print(f"   - {feature.name}")
+            print(f"   - {os.path.basename(feature)}")
         
-        return [str(f) for f in feature_files]
+        return feature_files
     
     def create_remote_driver(self):
         """
@@ -108,10 +175,125 @@ class TestController:
             print(f"Failed to create Remote WebDriver: {e}")
             return None
     
+    def available_cpus(self):
+        """
+        Bu process'in kullanabileceği CPU sayısı
+        os.cpu_count() pod içinde host'un core sayısını döner; affinity ve
+        cgroup CPU limiti (cpu.max) dikkate alınır
+        """
+        try:
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:
+            # sched_getaffinity sadece Linux'ta var
+            cpus = os.cpu_count() or 1
+
+        try:
+            with open("/sys/fs/cgroup/cpu.max") as f:
+                quota, period = f.read().split()[:2]
+            if quota != "max":
+                cpus = min(cpus, max(1, -(-int(quota) // int(period))))
+        except (OSError, ValueError):
+            pass
+
+        return cpus
+
+    def shard_feature_files(self, feature_files):
+        """
+        Feature dosyalarını paralel behave process'leri için shard'lara böler
+        (round-robin, CPU sayısına ve Grid kapasitesine göre)
+        """
+        shard_count = max(1, self.available_cpus() - 2)
+        if NODE_COUNT:
+            # Her Chrome Node tek session kabul eder; fazla shard kuyrukta bekler
+            shard_count = min(shard_count, max(1, int(NODE_COUNT)))
+        shard_count = min(shard_count, max(1, len(feature_files)))
+
+        shards = [[] for _ in range(shard_count)]
+        for index, feature in enumerate(feature_files):
+            shards[index % shard_count].append(feature)
+
+        return shards
+
+    def run_behave_shard(self, shard_id, feature_files):
+        """
+        Tek bir shard için behave'i ayrı bir subprocess olarak çalıştırır
+        """
+        outfile = f"test_results_{shard_id}.json"
+        cmd = [
+            "behave",
+            # Sadece JSON formatter: özet Python tarafında sonuç dosyasından üretilir
+            "--format", "json",
+            "--outfile", outfile,
+            "--no-color",
+            "--no-summary",
+            "--no-capture",  # Output'u göster
+            "--no-capture-stderr"
+        ]
+        cmd.extend(feature_files)
+
+        env = os.environ.copy()
+        env["BEHAVE_SHARD_ID"] = str(shard_id)
+
+        print(f"[shard {shard_id}] Running command: {' '.join(cmd)}")
+
+        # Output'u biriktirmeden satır satır aktar (sabit bellek, anlık log)
+        process = subprocess.Popen(
+            cmd,
+            cwd=os.getcwd(),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        for line in process.stdout:
+            sys.stdout.write(f"[shard {shard_id}] {line}")
+            # stdout pod içinde pipe: flush olmadan satırlar 8 KB bloklar halinde görünür
+            sys.stdout.flush()
+        process.stdout.close()
+
+        return shard_id, outfile, process.wait()
+
+    def merge_test_results(self, outfiles):
+        """
+        Shard JSON sonuçlarını tek bir test_results.json dosyasında birleştirir
+        """
+        merged = []
+        for outfile in outfiles:
+            try:
+                with open(outfile, "rb") as f:
+                    merged.extend(orjson.loads(f.read()))
+            except (OSError, orjson.JSONDecodeError) as e:
+                print(f"Could not read shard results {outfile}: {e}")
+
+        with open(RESULTS_FILE, "wb") as f:
+            f.write(orjson.dumps(merged))
+
+        print(f"Merged {len(outfiles)} shard result(s) into {RESULTS_FILE}")
+        return merged
+
+    def summarize_test_results(self, features):
+        """
+        Birleştirilmiş sonuçlardan kısa bir senaryo özeti yazdırır
+        merge_test_results'ın bellekteki listesi kullanılır; dosya tekrar okunmaz
+        """
+        counts = {}
+        for feature in features:
+            for element in feature.get("elements", []):
+                if element.get("type") != "scenario":
+                    continue
+                status = element.get("status", "untested")
+                counts[status] = counts.get(status, 0) + 1
+
+        summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+        print(f"\n{len(features)} feature(s), {sum(counts.values())} scenario(s): {summary or 'none'}")
+        return counts
+
     def execute_tests_with_behave(self, feature_files):
         """
         Behave framework kullanarak test'leri çalıştırır
-        Remote WebDriver üzerinden Chrome Node'a bağlanır
+        Feature dosyaları shard'lara bölünür ve paralel behave process'leri
+        üzerinden Remote WebDriver ile Chrome Node'lara gönderilir
         """
         print("\nStarting test execution...")
         
@@ -120,48 +302,30 @@ class TestController:
         os.environ["SELENIUM_REMOTE_URL"] = f"{self.chrome_node_url}/wd/hub"
         
         try:
-            # Behave komutunu çalıştır
-            cmd = [
-                "behave",
-                "--format", "pretty",
-                "--format", "json",
-                "--outfile", "test_results.json",
-                "--no-capture",  # Output'u göster
-                "--no-capture-stderr"
-            ]
-            
-            # Specific feature files varsa ekle
-            if feature_files:
-                cmd.extend(feature_files)
-            
-            print(f"Running command: {' '.join(cmd)}")
-            
-            # Subprocess ile behave'i çalıştır
-            result = subprocess.run(
-                cmd,
-                cwd=os.getcwd(),
-                capture_output=True,
-                text=True
-            )
-            
+            shards = self.shard_feature_files(feature_files)
+            print(f"Running {len(feature_files)} feature file(s) in {len(shards)} shard(s)")
+
             print("\n" + "="*50)
             print("TEST OUTPUT:")
             print("="*50)
-            print(result.stdout)
-            
-            if result.stderr:
-                print("\n" + "="*50)
-                print("ERRORS:")
-                print("="*50)
-                print(result.stderr)
-            
+
+            # Her shard kendi behave subprocess'inde çalışır; thread'ler output'u aktarır
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                results = list(executor.map(self.run_behave_shard, range(len(shards)), shards))
+
+            merged = self.merge_test_results([outfile for _, outfile, _ in results])
+            self.summarize_test_results(merged)
+
             # Exit code kontrol et
-            if result.returncode == 0:
+            success = all(returncode == 0 for _, _, returncode in results)
+            if success:
                 print("\nAll tests passed!")
             else:
-                print(f"\nTests failed with exit code: {result.returncode}")
+                for shard_id, _, returncode in results:
+                    if returncode != 0:
+                        print(f"\nShard {shard_id} failed with exit code: {returncode}")
             
-            return result.returncode == 0
+            return success
             
         except Exception as e:
             print(f"Test execution failed: {e}")
@@ -201,31 +365,34 @@ class TestController:
         print("TEST CONTROLLER POD STARTED")
         print("="*60 + "\n")
         
-        # 1. Chrome Node'ların hazır olmasını bekle
-        if not self.check_chrome_node_health():
-            print("Chrome Nodes are not ready. Exiting...")
-            sys.exit(1)
+        try:
+            # 1. Chrome Node'ların hazır olmasını bekle
+            if not self.check_chrome_node_health():
+                print("Chrome Nodes are not ready. Exiting...")
+                sys.exit(1)
         
-        # 2. Test feature dosyalarını topla
-        feature_files = self.collect_test_features()
+            # 2. Test feature dosyalarını topla
+            feature_files = self.collect_test_features()
         
-        if not feature_files:
-            print("No feature files found. Nothing to test.")
-            sys.exit(0)
+            if not feature_files:
+                print("No feature files found. Nothing to test.")
+                sys.exit(0)
         
-        # 3. Test'leri çalıştır
-        success = self.execute_tests_with_behave(feature_files)
+            # 3. Test'leri çalıştır
+            success = self.execute_tests_with_behave(feature_files)
         
-        # 4. Sonuç
-        print("\n" + "="*60)
-        if success:
-            print("TEST CONTROLLER COMPLETED SUCCESSFULLY")
-            print("="*60)
-            sys.exit(0)
-        else:
-            print("TEST CONTROLLER COMPLETED WITH FAILURES")
-            print("="*60)
-            sys.exit(1)
+            # 4. Sonuç
+            print("\n" + "="*60)
+            if success:
+                print("TEST CONTROLLER COMPLETED SUCCESSFULLY")
+                print("="*60)
+                sys.exit(0)
+            else:
+                print("TEST CONTROLLER COMPLETED WITH FAILURES")
+                print("="*60)
+                sys.exit(1)
+        finally:
+            self.session.close()
 
 
 def main():
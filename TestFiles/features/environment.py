@@ -3,14 +3,27 @@ Behave environment configuration
 This file contains hooks that run before/after scenarios, features, etc.
 """
 
+from functools import cached_property
 from utilities.driver import Driver
 from pages.login_page import LoginPage
 # from pages.dashboard_page import DashboardPage
 from utilities.reusable_methods import ReusableMethods
 
+class Pages:
+    """Page objects of a scenario, created on first access"""
+
+    @cached_property
+    def login(self):
+        return LoginPage()
+
+    # @cached_property
+    # def dashboard(self):
+    #     return DashboardPage()
+
 def before_all(context):
     """Runs once before all tests"""
-    pass
+    # ReusableMethods is stateless, one instance serves every scenario
+    context.reusable_methods = ReusableMethods()
 
 def before_feature(context, feature):
     """Runs before each feature"""
@@ -18,22 +31,31 @@ def before_feature(context, feature):
 
 def before_scenario(context, scenario):
     """Runs before each scenario"""
-    # Initialize page objects for each scenario
-    context.login_page = LoginPage()
-    # context.dashboard_page = DashboardPage()
-    context.reusable_methods = ReusableMethods()
+    # Page objects are built lazily, so the driver is only started when a step needs it
+    context.pages = Pages()
+    # Reset only clears the last-visited domain; @fresh_browser gets a new session
+    if "fresh_browser" in scenario.effective_tags:
+        Driver.close_driver()
 
 def after_scenario(context, scenario):
     """Runs after each scenario"""
-    # Close driver after each scenario if it's still open
+    # Keep the browser for the next scenario and only reset its state;
+    # a failed scenario still gets a fresh browser
     try:
-        Driver.close_driver()
+        if scenario.status == "failed":
+            Driver.close_driver()
+        else:
+            Driver.reset()
     except Exception as e:
-        print(f"Error closing driver: {e}")
+        print(f"Error resetting driver: {e}")
+        Driver.close_driver()
 
 def after_feature(context, feature):
     """Runs after each feature"""
-    pass
+    try:
+        Driver.close_driver()
+    except Exception as e:
+        print(f"Error closing driver: {e}")
 
 def after_all(context):
     """Runs once after all tests"""
@@ -1,9 +1,7 @@
-from pages.login_page import LoginPage
-from utilities.reusable_methods import ReusableMethods
-
 class BaseSteps:
     """Base class for all step definitions"""
 
-    def __init__(self):
-        self.login_page = LoginPage()
-        self.reusable_methods = ReusableMethods()
+    def __init__(self, context):
+        # Page objects are created lazily per scenario in environment.before_scenario
+        self.pages = context.pages
+        self.reusable_methods = context.reusable_methods
@@ -1,26 +1,27 @@
 from behave import given, when, then
 from utilities.reusable_methods import ReusableMethods
 from utilities.driver import Driver
+from pages.login_page import LoginPage
 
 @given('Goes to the given "{url}"')
 def step_navigate_to_url(context, url):
     """Navigate to the given URL"""
     ReusableMethods.navigate_to_url(url)
-    ReusableMethods.wait(10)
+    context.pages.login.wait_for_clickable(LoginPage.COMPANY_SELECT)
 
 @given('Click the Company button')
 def step_click_company_button(context):
     """Click the Company button"""
-    element = context.login_page.get_company_select()
-    Driver.get_driver().execute_script("arguments[0].click();", element)
-    ReusableMethods.wait(10)
+    ReusableMethods.click(context.pages.login.get_company_select())
+    # Careers may stay hidden in the dropdown; ReusableMethods.click falls back to JS
+    context.pages.login.find_element(LoginPage.CAREERS_SELECT)
 
 @given('Click the Careers button')
 def step_click_careers_button(context):
     """Click the Careers button"""
-    element = context.login_page.get_careers_select()
-    Driver.get_driver().execute_script("arguments[0].click();", element)
-    ReusableMethods.wait(10)
+    prev_url = Driver.get_driver().current_url
+    ReusableMethods.click(context.pages.login.get_careers_select())
+    context.pages.login.wait_for_url_change(prev_url)
 
 
 
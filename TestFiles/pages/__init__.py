@@ -0,0 +1,3 @@
+from pages.login_page import LoginPage
+
+__all__ = ["LoginPage"]
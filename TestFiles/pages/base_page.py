@@ -5,9 +5,18 @@ from utilities.driver import Driver
 class BasePage:
     """Base class for all page objects"""
 
+    __slots__ = ('driver', '_wait')
+
     def __init__(self):
         self.driver = Driver.get_driver()
-        self.wait = WebDriverWait(self.driver, 15)
+        self._wait = None
+
+    @property
+    def wait(self):
+        """WebDriverWait for this page, created on first use"""
+        if self._wait is None:
+            self._wait = WebDriverWait(self.driver, 15)
+        return self._wait
 
     def find_element(self, locator):
         """Find and return a single element"""
@@ -21,3 +30,11 @@ class BasePage:
         """Click on element"""
         element = self.wait.until(EC.element_to_be_clickable(locator))
         element.click()
+
+    def wait_for_clickable(self, locator):
+        """Wait until element is clickable and return it"""
+        return self.wait.until(EC.element_to_be_clickable(locator))
+
+    def wait_for_url_change(self, prev_url):
+        """Wait until the current URL differs from prev_url"""
+        return self.wait.until(EC.url_changes(prev_url))
@@ -4,6 +4,8 @@ from pages.base_page import BasePage
 class LoginPage(BasePage):
     """Page Object Model for Login Page"""
 
+    __slots__ = ()
+
     # Locators
     COMPANY_SELECT= (By.XPATH, "/html/body/nav/div[2]/div/ul[1]/li[6]/a")
     CAREERS_SELECT= (By.XPATH, "//*[@id='navbarNavDropdown']/ul[1]/li[6]/div/div[2]/a[2]")
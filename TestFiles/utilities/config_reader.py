@@ -1,25 +1,42 @@
 import os
-from jproperties import Properties
 
 class ConfigReader:
-    _properties = None
+    _cache = None
+    _int_cache = {}
 
     @classmethod
     def _load_properties(cls):
         """Load properties file if not already loaded"""
-        if cls._properties is None:
-            cls._properties = Properties()
+        if cls._cache is None:
             config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'configuration.properties')
             try:
                 with open(config_path, 'rb') as config_file:
-                    cls._properties.load(config_file)
+                    data = config_file.read().decode('utf-8')
             except Exception as e:
                 print(f"Error loading configuration file: {e}")
                 raise
+            # Simple key=value format: skip blank lines and comments
+            properties = {}
+            for line in data.splitlines():
+                line = line.strip()
+                if not line or line.startswith(('#', '!')) or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                properties[key.strip()] = value.strip()
+            cls._cache = properties
 
     @classmethod
     def get_property(cls, key):
         """Get property value by key"""
         cls._load_properties()
-        value = cls._properties.get(key)
-        return value.data if value else None
+        return cls._cache.get(key)
+
+    @classmethod
+    def get_int(cls, key, default=None):
+        """Get property value by key parsed as int"""
+        if key not in cls._int_cache:
+            value = cls.get_property(key)
+            if value is None or value.strip() == "":
+                return default
+            cls._int_cache[key] = int(value)
+        return cls._int_cache[key]
@@ -1,11 +1,27 @@
 import os
+import threading
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 from utilities.config_reader import ConfigReader
 import time
 
+# Paralel komutlar tek HTTP bağlantısında sıraya girmesin
+REMOTE_POOL_MAXSIZE = 16
+
+class PooledRemoteConnection(RemoteConnection):
+    """Grid'e host başına REMOTE_POOL_MAXSIZE bağlantı açabilen RemoteConnection"""
+
+    def _get_connection_manager(self):
+        # Proxy/CA ayarları korunur, sadece pool boyutu büyütülür
+        manager = super()._get_connection_manager()
+        manager.connection_pool_kw.update(maxsize=REMOTE_POOL_MAXSIZE, block=False)
+        return manager
+
 class Driver:
-    _driver = None
+    # One WebDriver per thread so parallel runners don't share a browser
+    _local = threading.local()
 
     def __init__(self):
         """Private constructor - use get_driver() instead"""
@@ -13,8 +29,9 @@ class Driver:
 
     @classmethod
     def get_driver(cls):
-        """Get or create WebDriver instance"""
-        if cls._driver is None:
+        """Get or create WebDriver instance for the current thread"""
+        driver = getattr(cls._local, "driver", None)
+        if driver is None:
             # Check if running in Kubernetes (Remote WebDriver mode)
             remote_url = os.getenv("SELENIUM_REMOTE_URL")
             
@@ -22,17 +39,19 @@ class Driver:
                 # Kubernetes mode - Use Remote WebDriver
                 print(f"Running in Kubernetes mode")
                 print(f"Connecting to Selenium Grid: {remote_url}")
-                cls._driver = cls._create_remote_driver(remote_url)
+                driver = cls._create_remote_driver(remote_url)
             else:
                 # Local mode - Use local WebDriver
                 print("Running in Local mode")
-                cls._driver = cls._create_local_driver()
+                driver = cls._create_local_driver()
             
             # Common configurations
-            cls._driver.maximize_window()
-            cls._driver.implicitly_wait(15)
+            # implicitly_wait kullanılmıyor: explicit WebDriverWait'lerle birleşip
+            # negatif durumlarda bekleme süresini katlıyor
+            driver.maximize_window()
+            cls._local.driver = driver
 
-        return cls._driver
+        return driver
 
     @classmethod
     def _create_remote_driver(cls, remote_url):
@@ -66,8 +85,10 @@ class Driver:
         options.add_argument("--disable-setuid-sandbox")
         
         try:
+            command_executor = PooledRemoteConnection(remote_url, keep_alive=True)
+
             driver = webdriver.Remote(
-                command_executor=remote_url,
+                command_executor=command_executor,
                 options=options
             )
             print(f"✅ Remote {browser.upper()} WebDriver created successfully")
@@ -108,14 +129,37 @@ class Driver:
         print(f"Local {browser.upper()} WebDriver created successfully")
         return driver
 
+    @classmethod
+    def reset(cls):
+        """
+        Reset browser state so the driver can be reused by the next scenario
+        Only the last-visited domain's cookies and storage are cleared;
+        scenarios that need full isolation should be tagged @fresh_browser
+        """
+        driver = getattr(cls._local, "driver", None)
+        if driver is None:
+            return
+        driver.delete_all_cookies()
+        # Storage must be cleared while the page's origin is still loaded
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            # about:blank / data: pages have no storage access
+            pass
+        # CDP is only available on local Chromium drivers, not on webdriver.Remote
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.get("about:blank")
+
     @classmethod
     def close_driver(cls):
-        """Close and quit the driver"""
-        if cls._driver is not None:
+        """Close and quit the current thread's driver"""
+        driver = getattr(cls._local, "driver", None)
+        if driver is not None:
             try:
-                cls._driver.quit()
+                driver.quit()
                 print("WebDriver closed successfully")
             except Exception as e:
                 print(f"Error closing driver: {e}")
             finally:
-                cls._driver = None
\ No newline at end of file
+                cls._local.driver = None
\ No newline at end of file
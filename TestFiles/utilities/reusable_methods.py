@@ -1,47 +1,71 @@
 import time
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+import functools
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+)
 from utilities.config_reader import ConfigReader
 from utilities.driver import Driver
 
 class ReusableMethods:
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _cached_property(key):
+        """Get configuration value, memoized for the whole test run"""
+        return ConfigReader.get_property(key)
+
     @staticmethod
     def get_company(company):
         """Get company from configuration"""
-        return ConfigReader.get_property(company)
+        return ReusableMethods._cached_property(company)
 
     @staticmethod
     def get_username(username):
         """Get username from configuration"""
-        return ConfigReader.get_property(username)
+        return ReusableMethods._cached_property(username)
 
     @staticmethod
     def get_password(password):
         """Get password from configuration"""
-        return ConfigReader.get_property(password)
+        return ReusableMethods._cached_property(password)
 
     def select_company(self, company_dropdown_table, company_dropdown_list, company):
         """Select company from dropdown"""
-        ReusableMethods.wait(2)
-        company_dropdown_table.click()
-        ReusableMethods.wait(2)
+        wait = WebDriverWait(Driver.get_driver(), 10, poll_frequency=0.1)
+        wait.until(EC.element_to_be_clickable(company_dropdown_table)).click()
+        if company_dropdown_list:
+            wait.until(EC.visibility_of(company_dropdown_list[0]))
 
         company_value = ReusableMethods.get_company(company)
-        for comp in company_dropdown_list:
-            if comp.text.lower() == company_value.lower():
-                comp.click()
-                break
+        # Read all entry texts in one script call instead of one getText command per entry;
+        # innerText is the rendered text, like WebElement.text
+        texts = Driver.get_driver().execute_script(
+            "return arguments[0].map(e => e.innerText.trim().toLowerCase());",
+            company_dropdown_list
+        )
+        if company_value.lower() not in texts:
+            raise NoSuchElementException(f"Company not found in dropdown: {company_value}")
+        company_dropdown_list[texts.index(company_value.lower())].click()
 
     @staticmethod
     def wait(seconds):
-        """Wait for specified seconds"""
+        """Wait for specified seconds (prefer WebDriverWait conditions in new steps)"""
+        time.sleep(seconds)
+
+    @staticmethod
+    def click(element):
+        """Click element natively, falling back to a JS click if it is covered or hidden"""
         try:
-            time.sleep(seconds)
-        except (TimeoutException, NoSuchElementException, StaleElementReferenceException, Exception) as e:
-            print(f"Exception in wait: {e}")
+            element.click()
+        except (ElementClickInterceptedException, ElementNotInteractableException):
+            Driver.get_driver().execute_script("arguments[0].click();", element)
 
     @staticmethod
     def navigate_to_url(url):
         """Navigate to the requested URL"""
-        url_value = ConfigReader.get_property(url)
+        url_value = ReusableMethods._cached_property(url)
         Driver.get_driver().get(url_value)
@@ -10,18 +10,39 @@ This script deploys and manages the Test Automation infrastructure on Kubernetes
 - Implements error handling and retry logic
 """
 
+import os
 import sys
 import time
+import shutil
+import threading
 import argparse
+import asyncio
 import subprocess
 import json
 from typing import Optional, Dict, List
 
+try:
+    # Optional: faster JSON parsing for pod list responses
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    # Optional: in-process API client reuses one HTTPS connection instead of forking kubectl
+    from kubernetes import client as k8s_client, config as k8s_config, watch as k8s_watch
+    from kubernetes.client.rest import ApiException
+except ImportError:
+    k8s_client = None
+
 # Configuration
 NAMESPACE = "test-automation"
 MAX_RETRIES = 5
 RETRY_DELAY = 10  # seconds
 DEPLOYMENT_TIMEOUT = 300  # 5 minutes
+MAX_CONCURRENT_COMMANDS = 4
+WAIT_SLICE = 10  # max seconds per kubectl wait call
+FINAL_PHASE_GRACE = 10  # seconds to wait for a final pod phase after logs end
+PHASE_POLL_INTERVAL = 30  # seconds between kubectl pod phase checks
 
 
 class Colors:
@@ -38,13 +59,24 @@ class Colors:
 class KubernetesDeployer:
     """Manages Kubernetes deployment for test automation"""
 
-    def __init__(self, node_count: int, manifests_dir: str = "k8s/manifests"):
+    # Log prefixes, resolved once at class creation
+    _LOG_FMT = {
+        "INFO": Colors.BLUE + "[INFO]" + Colors.END + " ",
+        "SUCCESS": Colors.GREEN + "[SUCCESS]" + Colors.END + " ",
+        "WARNING": Colors.YELLOW + "[WARNING]" + Colors.END + " ",
+        "ERROR": Colors.RED + "[ERROR]" + Colors.END + " "
+    }
+    _LOG_FMT_PLAIN = {level: f"[{level}] " for level in _LOG_FMT}
+
+    def __init__(self, node_count: int, manifests_dir: str = "k8s/manifests",
+                 skip_validation: bool = False):
         """
         Initialize deployer
 
         Args:
             node_count: Number of Chrome Node pods (1-5)
             manifests_dir: Directory containing Kubernetes YAML files
+            skip_validation: Pass --validate=false to kubectl apply (drops unknown fields silently)
         """
         if not 1 <= node_count <= 5:
             raise ValueError("node_count must be between 1 and 5")
@@ -52,37 +84,68 @@ class KubernetesDeployer:
         self.node_count = node_count
         self.manifests_dir = manifests_dir
         self.namespace = NAMESPACE
+        # Off by default: kubectl's default server-side field validation catches manifest typos
+        self.skip_validation = skip_validation
+        # Resolved to an absolute path by check_kubectl()
+        self._kubectl = "kubectl"
+
+        # No colors when output is piped (e.g. CI)
+        self._prefix = self._LOG_FMT if sys.stdout.isatty() else self._LOG_FMT_PLAIN
+
+        # Bounds concurrent kubectl processes, whether started from threads or coroutines
+        self._command_slots = threading.BoundedSemaphore(MAX_CONCURRENT_COMMANDS)
+
+        self.core_api = None
+        self.apps_api = None
+        self._init_api_clients()
+
+    def _init_api_clients(self):
+        """Create Kubernetes API clients if the kubernetes package is available"""
+        if k8s_client is None:
+            return
+
+        try:
+            try:
+                k8s_config.load_incluster_config()
+            except k8s_config.ConfigException:
+                k8s_config.load_kube_config()
+        except Exception as e:
+            self.log(f"Kubernetes API client unavailable, falling back to kubectl: {e}", "WARNING")
+            return
+
+        self.core_api = k8s_client.CoreV1Api()
+        self.apps_api = k8s_client.AppsV1Api()
 
     def log(self, message: str, level: str = "INFO"):
         """Print colored log message"""
-        colors = {
-            "INFO": Colors.BLUE,
-            "SUCCESS": Colors.GREEN,
-            "WARNING": Colors.YELLOW,
-            "ERROR": Colors.RED
-        }
-        color = colors.get(level, Colors.END)
-        print(f"{color}[{level}]{Colors.END} {message}")
+        prefix = self._prefix.get(level)
+        if prefix is None:
+            prefix = f"[{level}] "
+        sys.stdout.write(prefix + message + "\n")
 
-    def run_command(self, command: List[str], check: bool = True) -> Optional[subprocess.CompletedProcess]:
+    def run_command(self, command: List[str], check: bool = True,
+                    input: Optional[str] = None) -> Optional[subprocess.CompletedProcess]:
         """
         Execute shell command with error handling
 
         Args:
             command: Command and arguments as list
             check: Raise exception on non-zero exit code
+            input: Text passed to the command's stdin
 
         Returns:
             CompletedProcess or None on error
         """
         try:
             self.log(f"Running: {' '.join(command)}")
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=check
-            )
+            with self._command_slots:
+                result = subprocess.run(
+                    command,
+                    input=input,
+                    capture_output=True,
+                    text=True,
+                    check=check
+                )
             return result
         except subprocess.CalledProcessError as e:
             self.log(f"Command failed: {e.stderr}", "ERROR")
@@ -90,13 +153,164 @@ class KubernetesDeployer:
                 raise
             return None
 
+    async def run_command_async(self, command: List[str], check: bool = True,
+                                input: Optional[str] = None) -> Optional[subprocess.CompletedProcess]:
+        """
+        Execute shell command in a worker thread without blocking the event loop
+
+        Args:
+            command: Command and arguments as list
+            check: Raise exception on non-zero exit code
+            input: Text passed to the command's stdin
+
+        Returns:
+            CompletedProcess or None on error
+        """
+        return await asyncio.to_thread(self.run_command, command, check, input)
+
+    def apply_manifests_batched(self, paths: List[str]) -> Optional[subprocess.CompletedProcess]:
+        """
+        Apply several manifest files with a single kubectl invocation
+
+        Args:
+            paths: Manifest file paths, applied in the given order
+
+        Returns:
+            CompletedProcess or None on error
+        """
+        documents = []
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8") as manifest:
+                    documents.append(manifest.read())
+            except OSError as e:
+                self.log(f"Cannot read manifest {path}: {e}", "ERROR")
+                return None
+
+        command = [self._kubectl, "apply", "-f", "-", "-n", self.namespace]
+        if self.skip_validation:
+            command.append("--validate=false")
+
+        # One process = one client-side discovery/schema load for all manifests
+        return self.run_command(
+            command,
+            check=False,
+            input="\n---\n".join(documents)
+        )
+
+    def list_pods(self, label_selector: str) -> Optional[List[Dict]]:
+        """
+        List pods matching a label selector
+
+        Args:
+            label_selector: Kubernetes label selector
+
+        Returns:
+            List of {"name", "phase", "ready", "terminating"} dicts or None on error
+        """
+        if self.core_api is not None:
+            try:
+                # Raw JSON: skip deserializing every pod into V1Pod models
+                response = self.core_api.list_namespaced_pod(
+                    self.namespace, label_selector=label_selector,
+                    _preload_content=False
+                )
+                pods = _json.loads(response.data).get("items", [])
+            except ApiException as e:
+                self.log(f"Failed to list pods: {e.reason}", "ERROR")
+                return None
+            except (json.JSONDecodeError, ValueError) as e:
+                self.log(f"Failed to parse pod status: {e}", "ERROR")
+                return None
+
+            return [
+                {
+                    "name": pod["metadata"]["name"],
+                    "phase": pod.get("status", {}).get("phase"),
+                    "ready": any(
+                        c["type"] == "Ready" and c["status"] == "True"
+                        for c in pod.get("status", {}).get("conditions", [])
+                    ),
+                    "terminating": "deletionTimestamp" in pod["metadata"]
+                }
+                for pod in pods
+            ]
+
+        # Only name, phase, Ready status and deletion time are printed, one pod per line
+        result = self.run_command([
+            self._kubectl, "get", "pods",
+            "-n", self.namespace,
+            "-l", label_selector,
+            "-o", r'jsonpath={range .items[*]}{.metadata.name}{"\t"}{.status.phase}'
+                  r'{"\t"}{.status.conditions[?(@.type=="Ready")].status}'
+                  r'{"\t"}{.metadata.deletionTimestamp}{"\n"}{end}'
+        ], check=False)
+
+        if not result or result.returncode != 0:
+            return None
+
+        pods = []
+        for line in result.stdout.splitlines():
+            if not line.strip():
+                continue
+            name, phase, ready, deleted = (line.split("\t") + ["", "", ""])[:4]
+            pods.append({
+                "name": name,
+                "phase": phase or None,
+                "ready": ready == "True",
+                "terminating": bool(deleted)
+            })
+
+        return pods
+
+    @staticmethod
+    def _is_pod_ready(pod) -> bool:
+        """Check the Ready condition of a kubernetes client V1Pod"""
+        return any(
+            c.type == "Ready" and c.status == "True"
+            for c in (pod.status.conditions or [])
+        )
+
+    def get_endpoint_count(self, service: str) -> Optional[int]:
+        """
+        Count ready endpoint addresses of a service
+
+        Args:
+            service: Service name
+
+        Returns:
+            Number of endpoint addresses or None on error
+        """
+        if self.core_api is not None:
+            try:
+                endpoints = self.core_api.read_namespaced_endpoints(service, self.namespace)
+            except ApiException as e:
+                self.log(f"Failed to read endpoints: {e.reason}", "ERROR")
+                return None
+
+            return sum(len(s.addresses or []) for s in (endpoints.subsets or []))
+
+        # Only the ready addresses are printed (space separated)
+        result = self.run_command([
+            self._kubectl, "get", "endpoints", service,
+            "-n", self.namespace,
+            "-o", "jsonpath={.subsets[*].addresses[*].ip}"
+        ], check=False)
+
+        if not result or result.returncode != 0:
+            return None
+
+        return len(result.stdout.split())
+
     def check_kubectl(self) -> bool:
         """Verify kubectl is installed and configured"""
         self.log("Checking kubectl installation...")
-        result = self.run_command(["kubectl", "version", "--client"], check=False)
+        # A PATH lookup is enough - no need to fork "kubectl version --client"
+        path = shutil.which("kubectl")
 
-        if result and result.returncode == 0:
-            self.log("kubectl is installed", "SUCCESS")
+        if path is not None:
+            self._kubectl = path
+            self.log(f"kubectl is installed: {path}", "SUCCESS")
             return True
         else:
             self.log("kubectl not found or not configured", "ERROR")
@@ -105,133 +319,132 @@ class KubernetesDeployer:
     def check_cluster_connection(self) -> bool:
         """Verify connection to Kubernetes cluster"""
         self.log("Checking cluster connection...")
-        result = self.run_command(["kubectl", "cluster-info"], check=False)
+        result = self.run_command([self._kubectl, "cluster-info"], check=False)
 
         if result and result.returncode == 0:
             self.log("Connected to cluster", "SUCCESS")
+            # Warm kubectl's shared discovery cache (~/.kube/cache) once,
+            # before kubectl calls start running concurrently
+            self.run_command([self._kubectl, "api-resources", "--cached=true"], check=False)
             return True
         else:
             self.log("Cannot connect to cluster", "ERROR")
             return False
 
-    def create_namespace(self) -> bool:
-        """Create namespace if it doesn't exist"""
-        self.log(f"Creating namespace: {self.namespace}")
+    def deploy_base_manifests(self) -> bool:
+        """Apply namespace, Chrome Node deployment and Chrome Node Service in one batch"""
+        self.log(f"Applying namespace {self.namespace}, Chrome Node deployment and service...")
 
-        # Check if namespace exists
-        result = self.run_command(
-            ["kubectl", "get", "namespace", self.namespace],
-            check=False
-        )
+        result = self.apply_manifests_batched([
+            f"{self.manifests_dir}/01-namespace.yaml",
+            f"{self.manifests_dir}/03-chrome-node-deployment.yaml",
+            f"{self.manifests_dir}/04-chrome-node-service.yaml"
+        ])
 
         if result and result.returncode == 0:
-            self.log(f"Namespace {self.namespace} already exists", "WARNING")
-            return True
-
-        # Create namespace
-        result = self.run_command(
-            ["kubectl", "apply", "-f", f"{self.manifests_dir}/01-namespace.yaml"],
-            check=False
-        )
-
-        if result and result.returncode == 0:
-            self.log(f"Namespace {self.namespace} created", "SUCCESS")
+            self.log("Namespace, Chrome Node deployment and service applied", "SUCCESS")
             return True
         else:
-            self.log("Failed to create namespace", "ERROR")
+            self.log(f"Failed to apply manifests: {result.stderr if result else ''}", "ERROR")
             return False
 
     def deploy_configmap(self) -> bool:
         """Deploy ConfigMap with node_count parameter"""
         self.log(f"Deploying ConfigMap with node_count={self.node_count}")
 
-        # Try to create ConfigMap imperatively
+        # Render the ConfigMap directly; every field is already known here
+        yaml_doc = (
+            "apiVersion: v1\n"
+            "kind: ConfigMap\n"
+            "metadata:\n"
+            "  name: test-automation-config\n"
+            f"  namespace: {self.namespace}\n"
+            "data:\n"
+            f"  node_count: \"{self.node_count}\"\n"
+            "  max_retries: \"5\"\n"
+            "  retry_delay: \"10\"\n"
+            "  chrome_node_service: http://chrome-node-service:4444\n"
+        )
+
+        command = [self._kubectl, "apply", "-f", "-"]
+        if self.skip_validation:
+            command.append("--validate=false")
+
         try:
-            # Generate YAML
-            create_result = subprocess.run([
-                "kubectl", "create", "configmap", "test-automation-config",
-                f"--from-literal=node_count={self.node_count}",
-                "--from-literal=max_retries=5",
-                "--from-literal=retry_delay=10",
-                "--from-literal=chrome_node_service=http://chrome-node-service:4444",
-                "-n", self.namespace,
-                "--dry-run=client",
-                "-o", "yaml"
-            ], capture_output=True, text=True)
-
-            if create_result.returncode == 0:
-                # Apply the YAML
-                apply_result = subprocess.run(
-                    ["kubectl", "apply", "-f", "-"],
-                    input=create_result.stdout,
-                    capture_output=True,
-                    text=True
-                )
+            apply_result = self.run_command(
+                command,
+                check=False,
+                input=yaml_doc
+            )
 
-                if apply_result.returncode == 0:
-                    self.log("ConfigMap deployed", "SUCCESS")
-                    return True
-                else:
-                    self.log(f"Failed to apply ConfigMap: {apply_result.stderr}", "WARNING")
+            if apply_result.returncode == 0:
+                self.log("ConfigMap deployed", "SUCCESS")
+                return True
+            else:
+                self.log(f"Failed to apply ConfigMap: {apply_result.stderr}", "WARNING")
         except Exception as e:
-            self.log(f"Failed to create ConfigMap imperatively: {e}", "WARNING")
+            self.log(f"Failed to apply generated ConfigMap: {e}", "WARNING")
 
         # Fallback: apply from file
         self.log("Using ConfigMap from file", "WARNING")
-        result = self.run_command([
-            "kubectl", "apply", "-f", f"{self.manifests_dir}/02-configmap.yaml"
-        ], check=False)
+        result = self.apply_manifests_batched([f"{self.manifests_dir}/02-configmap.yaml"])
 
         return result and result.returncode == 0
 
     def scale_chrome_nodes(self) -> bool:
         """
-        Scale Chrome Node deployment to specified node_count
+        Scale the existing Chrome Node deployment to specified node_count
 
         Returns:
             True if scaling succeeded
         """
         self.log(f"Scaling Chrome Nodes to {self.node_count} replicas...")
 
-        # First, ensure deployment exists
-        result = self.run_command([
-            "kubectl", "apply", "-f", f"{self.manifests_dir}/03-chrome-node-deployment.yaml"
-        ], check=False)
-
-        if not result or result.returncode != 0:
-            self.log("Failed to create/update Chrome Node deployment", "ERROR")
-            return False
+        # The deployment itself is applied by deploy_base_manifests()
 
         # Scale to desired replica count
-        result = self.run_command([
-            "kubectl", "scale", "deployment", "chrome-node",
-            f"--replicas={self.node_count}",
-            "-n", self.namespace
-        ], check=False)
+        if self.apps_api is not None:
+            try:
+                self.apps_api.patch_namespaced_deployment_scale(
+                    "chrome-node", self.namespace,
+                    {"spec": {"replicas": self.node_count}}
+                )
+                scaled = True
+            except ApiException as e:
+                self.log(f"Scale request failed: {e.reason}", "ERROR")
+                scaled = False
+        else:
+            result = self.run_command([
+                self._kubectl, "scale", "deployment", "chrome-node",
+                f"--replicas={self.node_count}",
+                "-n", self.namespace
+            ], check=False)
+            scaled = bool(result and result.returncode == 0)
 
-        if result and result.returncode == 0:
+        if scaled:
             self.log(f"Chrome Nodes scaled to {self.node_count}", "SUCCESS")
             return True
         else:
             self.log("Failed to scale Chrome Nodes", "ERROR")
             return False
 
-    def deploy_chrome_node_service(self) -> bool:
-        """Deploy Chrome Node Service for inter-pod communication"""
-        self.log("Deploying Chrome Node Service...")
+    @staticmethod
+    def _is_transient_wait_error(stderr: str) -> bool:
+        """
+        Check whether a failed kubectl wait is worth retrying
 
-        result = self.run_command([
-            "kubectl", "apply", "-f", f"{self.manifests_dir}/04-chrome-node-service.yaml"
-        ], check=False)
+        Args:
+            stderr: kubectl wait error output
 
-        if result and result.returncode == 0:
-            self.log("Chrome Node Service deployed", "SUCCESS")
-            return True
-        else:
-            self.log("Failed to deploy Chrome Node Service", "ERROR")
-            return False
+        Returns:
+            True if pods were missing, replaced mid-wait or the wait timed out
+        """
+        return any(
+            marker in stderr
+            for marker in ("no matching resources", "not found", "timed out")
+        )
 
-    def wait_for_chrome_nodes_ready(self, timeout: int = DEPLOYMENT_TIMEOUT) -> bool:
+    async def wait_for_chrome_nodes_ready(self, timeout: int = DEPLOYMENT_TIMEOUT) -> bool:
         """
         Wait for all Chrome Node pods to be ready
 
@@ -243,59 +456,95 @@ class KubernetesDeployer:
         """
         self.log(f"Waiting for {self.node_count} Chrome Node pods to be ready...")
 
-        start_time = time.time()
+        if self.core_api is not None:
+            return await asyncio.to_thread(self._watch_chrome_nodes_ready, timeout)
 
-        while time.time() - start_time < timeout:
-            # Get pod status
-            result = self.run_command([
-                "kubectl", "get", "pods",
-                "-n", self.namespace,
+        # kubectl wait watches the pods server-side instead of polling from Python.
+        # Each wait is bounded so a pod terminating after scale down can't
+        # hold it until the deadline; readiness is decided from list_pods.
+        deadline = time.time() + timeout
+        last_ready = None
+
+        while time.time() < deadline:
+            remaining = max(1, min(WAIT_SLICE, int(deadline - time.time())))
+            result = await self.run_command_async([
+                self._kubectl, "wait", "--for=condition=Ready", "pod",
                 "-l", "component=chrome-node",
-                "-o", "json"
+                "--timeout", f"{remaining}s",
+                "-n", self.namespace
             ], check=False)
 
-            if not result or result.returncode != 0:
-                self.log("Failed to get pod status", "ERROR")
-                time.sleep(5)
-                continue
+            if not result:
+                self.log("kubectl wait failed", "ERROR")
+                return False
+            if result.returncode != 0 and not self._is_transient_wait_error(result.stderr):
+                self.log(f"kubectl wait failed: {result.stderr.strip()}", "ERROR")
+                return False
+
+            # kubectl wait only covers pods that existed when it started
+            pods = await asyncio.to_thread(self.list_pods, "component=chrome-node") or []
+            ready_count = sum(1 for pod in pods if pod["ready"] and not pod["terminating"])
+            if ready_count != last_ready:
+                self.log(f"Ready: {ready_count}/{self.node_count} Chrome Nodes")
+                last_ready = ready_count
 
-            try:
-                pods_data = json.loads(result.stdout)
-                pods = pods_data.get("items", [])
-
-                if len(pods) != self.node_count:
-                    self.log(f"Found {len(pods)}/{self.node_count} pods, waiting...", "WARNING")
-                    time.sleep(5)
-                    continue
-
-                # Check if all pods are ready
-                ready_count = 0
-                for pod in pods:
-                    pod_name = pod["metadata"]["name"]
-                    status = pod.get("status", {})
-                    conditions = status.get("conditions", [])
-
-                    # Check Ready condition
-                    for condition in conditions:
-                        if condition["type"] == "Ready" and condition["status"] == "True":
-                            ready_count += 1
-                            break
+            if ready_count >= self.node_count:
+                self.log("All Chrome Nodes are ready!", "SUCCESS")
+                return True
 
-                self.log(f"Ready: {ready_count}/{self.node_count} Chrome Nodes")
+            # Pods not created yet or replaced mid-wait - kubectl wait needs existing pods
+            await asyncio.sleep(2)
 
-                if ready_count == self.node_count:
-                    self.log("All Chrome Nodes are ready!", "SUCCESS")
-                    return True
+        self.log(f"Timeout waiting for Chrome Nodes (>{timeout}s)", "ERROR")
+        return False
 
-            except json.JSONDecodeError as e:
-                self.log(f"Failed to parse pod status: {e}", "ERROR")
+    def _watch_chrome_nodes_ready(self, timeout: int) -> bool:
+        """
+        Wait for Chrome Node readiness using a watch stream instead of re-listing pods
+
+        Args:
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if all pods are ready
+        """
+        ready = set()
+        w = k8s_watch.Watch()
 
-            time.sleep(5)
+        try:
+            for event in w.stream(
+                self.core_api.list_namespaced_pod,
+                namespace=self.namespace,
+                label_selector="component=chrome-node",
+                timeout_seconds=timeout
+            ):
+                pod = event["object"]
+                uid = pod.metadata.uid
+                was_ready = uid in ready
+
+                # Terminating pods (e.g. after scale down) don't count
+                if (event["type"] != "DELETED"
+                        and pod.metadata.deletion_timestamp is None
+                        and self._is_pod_ready(pod)):
+                    ready.add(uid)
+                else:
+                    ready.discard(uid)
+
+                if was_ready != (uid in ready):
+                    self.log(f"Ready: {len(ready)}/{self.node_count} Chrome Nodes")
+
+                if len(ready) >= self.node_count:
+                    w.stop()
+                    self.log("All Chrome Nodes are ready!", "SUCCESS")
+                    return True
+        except ApiException as e:
+            self.log(f"Failed to watch pod status: {e.reason}", "ERROR")
+            return False
 
         self.log(f"Timeout waiting for Chrome Nodes (>{timeout}s)", "ERROR")
         return False
 
-    def verify_chrome_node_service(self) -> bool:
+    async def verify_chrome_node_service(self) -> bool:
         """
         Verify Chrome Node Service has endpoints
 
@@ -305,28 +554,16 @@ class KubernetesDeployer:
         self.log("Verifying Chrome Node Service endpoints...")
 
         for attempt in range(MAX_RETRIES):
-            result = self.run_command([
-                "kubectl", "get", "endpoints", "chrome-node-service",
-                "-n", self.namespace,
-                "-o", "json"
-            ], check=False)
-
-            if result and result.returncode == 0:
-                try:
-                    endpoints_data = json.loads(result.stdout)
-                    subsets = endpoints_data.get("subsets", [])
+            endpoint_count = await asyncio.to_thread(self.get_endpoint_count, "chrome-node-service")
 
-                    if subsets and any(s.get("addresses") for s in subsets):
-                        endpoint_count = sum(len(s.get("addresses", [])) for s in subsets)
-                        self.log(f"Service has {endpoint_count} endpoints", "SUCCESS")
-                        return True
-                    else:
-                        self.log(f"Service has no endpoints (attempt {attempt + 1}/{MAX_RETRIES})", "WARNING")
-                except json.JSONDecodeError:
-                    self.log("Failed to parse endpoints", "ERROR")
+            if endpoint_count:
+                self.log(f"Service has {endpoint_count} endpoints", "SUCCESS")
+                return True
+            elif endpoint_count is not None:
+                self.log(f"Service has no endpoints (attempt {attempt + 1}/{MAX_RETRIES})", "WARNING")
 
             if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY)
+                await asyncio.sleep(RETRY_DELAY)
 
         self.log("Service has no endpoints after max retries", "ERROR")
         return False
@@ -335,9 +572,7 @@ class KubernetesDeployer:
         """Deploy Test Controller Pod"""
         self.log("Deploying Test Controller...")
 
-        result = self.run_command([
-            "kubectl", "apply", "-f", f"{self.manifests_dir}/05-test-controller-deployment.yaml"
-        ], check=False)
+        result = self.apply_manifests_batched([f"{self.manifests_dir}/05-test-controller-deployment.yaml"])
 
         if result and result.returncode == 0:
             self.log("Test Controller deployed", "SUCCESS")
@@ -346,92 +581,198 @@ class KubernetesDeployer:
             self.log("Failed to deploy Test Controller", "ERROR")
             return False
 
-    def monitor_test_execution(self, timeout: int = 600) -> bool:
+    def wait_for_test_controller_pod(self, timeout: int = 60) -> Optional[str]:
         """
-        Monitor Test Controller pod and display logs
+        Wait for the Test Controller pod to appear
 
         Args:
             timeout: Maximum wait time in seconds
 
         Returns:
-            True if tests completed successfully
+            Pod name or None on timeout
         """
-        self.log("Monitoring test execution...")
+        if self.core_api is not None:
+            w = k8s_watch.Watch()
+            try:
+                for event in w.stream(
+                    self.core_api.list_namespaced_pod,
+                    namespace=self.namespace,
+                    label_selector="component=test-controller",
+                    timeout_seconds=timeout
+                ):
+                    if event["type"] != "DELETED":
+                        w.stop()
+                        return event["object"].metadata.name
+            except ApiException as e:
+                self.log(f"Failed to watch Test Controller pod: {e.reason}", "ERROR")
+            return None
 
-        start_time = time.time()
+        # kubectl wait uses a server-side watch instead of polling from Python
+        deadline = time.time() + timeout
 
-        # Wait for Test Controller pod to start
-        while time.time() - start_time < 60:
+        while time.time() < deadline:
+            remaining = max(1, int(deadline - time.time()))
             result = self.run_command([
-                "kubectl", "get", "pods",
-                "-n", self.namespace,
+                self._kubectl, "wait", "--for=condition=PodScheduled", "pod",
                 "-l", "component=test-controller",
-                "-o", "json"
+                "-n", self.namespace,
+                f"--timeout={remaining}s"
             ], check=False)
 
-            if result and result.returncode == 0:
-                try:
-                    pods_data = json.loads(result.stdout)
-                    pods = pods_data.get("items", [])
+            if not result:
+                return None
+            if result.returncode != 0 and not self._is_transient_wait_error(result.stderr):
+                self.log(f"kubectl wait failed: {result.stderr.strip()}", "ERROR")
+                return None
 
-                    if pods:
-                        pod_name = pods[0]["metadata"]["name"]
-                        self.log(f"Test Controller pod: {pod_name}", "SUCCESS")
-                        break
-                except json.JSONDecodeError:
-                    pass
+            # Skip the previous controller pod if it is still terminating
+            pods = self.list_pods("component=test-controller") or []
+            for pod in pods:
+                if not pod["terminating"]:
+                    return pod["name"]
 
+            # The ReplicaSet has not created the pod yet - kubectl wait needs an existing pod
             time.sleep(2)
-        else:
+
+        return None
+
+    async def _stream_logs(self, process: asyncio.subprocess.Process):
+        """Print log lines of a running kubectl logs process as they arrive"""
+        async for line in process.stdout:
+            print(line.decode(errors="replace"), end="", flush=True)
+
+    def _watch_final_phase(self, label_selector: str, stop: threading.Event) -> Optional[str]:
+        """
+        Watch pod phase until it reaches Succeeded or Failed
+
+        Args:
+            label_selector: Kubernetes label selector
+            stop: Set by the caller to end the watch
+
+        Returns:
+            Final pod phase or None if stopped or the watch failed
+        """
+        w = k8s_watch.Watch()
+        try:
+            # Short watch windows so a stop request is noticed without an event
+            while not stop.is_set():
+                for event in w.stream(
+                    self.core_api.list_namespaced_pod,
+                    namespace=self.namespace,
+                    label_selector=label_selector,
+                    timeout_seconds=WAIT_SLICE
+                ):
+                    phase = event["object"].status.phase
+                    if event["type"] != "DELETED" and phase in ("Succeeded", "Failed"):
+                        w.stop()
+                        return phase
+                    if stop.is_set():
+                        w.stop()
+                        break
+        except ApiException as e:
+            self.log(f"Failed to watch pod phase: {e.reason}", "WARNING")
+        return None
+
+    async def _poll_final_phase(self, label_selector: str) -> str:
+        """
+        Wait until the pod phase reaches Succeeded or Failed
+
+        Uses a watch when the Kubernetes client is available; otherwise
+        polls through kubectl every PHASE_POLL_INTERVAL seconds.
+
+        Args:
+            label_selector: Kubernetes label selector
+
+        Returns:
+            Final pod phase
+        """
+        if self.core_api is not None:
+            stop = threading.Event()
+            try:
+                phase = await asyncio.to_thread(self._watch_final_phase, label_selector, stop)
+            finally:
+                stop.set()
+            if phase is not None:
+                return phase
+
+        while True:
+            pods = await asyncio.to_thread(self.list_pods, label_selector)
+            if pods and pods[0]["phase"] in ("Succeeded", "Failed"):
+                return pods[0]["phase"]
+            await asyncio.sleep(PHASE_POLL_INTERVAL)
+
+    async def monitor_test_execution(self, timeout: int = 600) -> bool:
+        """
+        Monitor Test Controller pod and display logs
+
+        Log streaming and the pod phase check run concurrently; the log
+        stream is stopped as soon as the pod reaches a final phase.
+
+        Args:
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if tests completed successfully
+        """
+        self.log("Monitoring test execution...")
+
+        # Wait for Test Controller pod to start
+        pod_name = await asyncio.to_thread(self.wait_for_test_controller_pod)
+        if pod_name is None:
             self.log("Test Controller pod not found", "ERROR")
             return False
 
+        self.log(f"Test Controller pod: {pod_name}", "SUCCESS")
+
         # Follow logs
         self.log("=" * 60)
         self.log("TEST CONTROLLER LOGS:", "INFO")
         self.log("=" * 60)
 
-        try:
-            subprocess.run([
-                "kubectl", "logs", "-f",
-                "-n", self.namespace,
-                "-l", "component=test-controller"
-            ])
-        except KeyboardInterrupt:
-            self.log("\nLog streaming interrupted", "WARNING")
-
-        # Check final status
-        result = self.run_command([
-            "kubectl", "get", "pods",
+        process = await asyncio.create_subprocess_exec(
+            self._kubectl, "logs", "-f",
             "-n", self.namespace,
             "-l", "component=test-controller",
-            "-o", "json"
-        ], check=False)
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        log_task = asyncio.create_task(self._stream_logs(process))
+        phase_task = asyncio.create_task(self._poll_final_phase("component=test-controller"))
 
-        if result and result.returncode == 0:
-            try:
-                pods_data = json.loads(result.stdout)
-                pods = pods_data.get("items", [])
-
-                if pods:
-                    status = pods[0].get("status", {})
-                    phase = status.get("phase")
-
-                    if phase == "Succeeded":
-                        self.log("Tests completed successfully!", "SUCCESS")
-                        return True
-                    elif phase == "Running":
-                        self.log("Tests are still running", "WARNING")
-                        return True
-                    else:
-                        self.log(f"Tests failed (status: {phase})", "ERROR")
-                        return False
-            except json.JSONDecodeError:
-                pass
+        try:
+            await asyncio.wait({log_task, phase_task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if process.returncode is None:
+                process.terminate()
+            await process.wait()
+            await asyncio.gather(log_task, return_exceptions=True)
+
+        phase = None
+        try:
+            # Log stream usually ends as the container exits; let the poller
+            # catch the final phase instead of issuing a separate query
+            phase = await asyncio.wait_for(phase_task, timeout=FINAL_PHASE_GRACE)
+        except asyncio.TimeoutError:
+            # Pod still not final - read its current status once
+            pods = await asyncio.to_thread(self.list_pods, "component=test-controller")
+            if pods:
+                phase = pods[0]["phase"]
+
+        if phase is None:
+            self.log("Could not determine Test Controller pod status", "ERROR")
+            return False
 
-        return False
+        if phase == "Succeeded":
+            self.log("Tests completed successfully!", "SUCCESS")
+            return True
+        elif phase == "Running":
+            self.log("Tests are still running", "WARNING")
+            return True
+        else:
+            self.log(f"Tests failed (status: {phase})", "ERROR")
+            return False
 
-    def deploy_all(self) -> bool:
+    async def deploy_all(self) -> bool:
         """
         Execute complete deployment workflow
 
@@ -444,42 +785,40 @@ class KubernetesDeployer:
         self.log("=" * 60)
 
         # Step 1: Pre-flight checks
-        if not self.check_kubectl():
+        if not await asyncio.to_thread(self.check_kubectl):
             return False
 
-        if not self.check_cluster_connection():
+        if not await asyncio.to_thread(self.check_cluster_connection):
             return False
 
-        # Step 2: Create namespace
-        if not self.create_namespace():
+        # Step 2: Create namespace, Chrome Node deployment and service (single apply)
+        if not await asyncio.to_thread(self.deploy_base_manifests):
             return False
 
-        # Step 3: Deploy ConfigMap
-        if not self.deploy_configmap():
-            return False
-
-        # Step 4: Deploy Chrome Nodes
-        if not self.scale_chrome_nodes():
-            return False
+        # Steps 3-4: Deploy ConfigMap and scale Chrome Nodes
+        # These only need the applied resources, so their API round-trips can overlap
+        results = await asyncio.gather(
+            asyncio.to_thread(self.deploy_configmap),
+            asyncio.to_thread(self.scale_chrome_nodes)
+        )
 
-        # Step 5: Deploy Chrome Node Service
-        if not self.deploy_chrome_node_service():
+        if not all(results):
             return False
 
-        # Step 6: Wait for Chrome Nodes to be ready
-        if not self.wait_for_chrome_nodes_ready():
+        # Step 5: Wait for Chrome Nodes to be ready
+        if not await self.wait_for_chrome_nodes_ready():
             return False
 
-        # Step 7: Verify Service endpoints
-        if not self.verify_chrome_node_service():
+        # Step 6: Verify Service endpoints
+        if not await self.verify_chrome_node_service():
             return False
 
-        # Step 8: Deploy Test Controller
-        if not self.deploy_test_controller():
+        # Step 7: Deploy Test Controller
+        if not await asyncio.to_thread(self.deploy_test_controller):
             return False
 
-        # Step 9: Monitor test execution
-        self.monitor_test_execution()
+        # Step 8: Monitor test execution
+        await self.monitor_test_execution()
 
         self.log("=" * 60)
         self.log("DEPLOYMENT COMPLETED", "SUCCESS")
@@ -492,7 +831,7 @@ class KubernetesDeployer:
         self.log("Cleaning up resources...")
 
         result = self.run_command([
-            "kubectl", "delete", "namespace", self.namespace
+            self._kubectl, "delete", "namespace", self.namespace
         ], check=False)
 
         if result and result.returncode == 0:
@@ -524,22 +863,31 @@ def main():
         action="store_true",
         help="Clean up all deployed resources"
     )
+    parser.add_argument(
+        "--skip-validation",
+        action="store_true",
+        help="Apply manifests with --validate=false (unknown fields are silently dropped)"
+    )
 
     args = parser.parse_args()
 
     try:
         deployer = KubernetesDeployer(
             node_count=args.node_count,
-            manifests_dir=args.manifests_dir
+            manifests_dir=args.manifests_dir,
+            skip_validation=args.skip_validation
         )
 
         if args.cleanup:
             success = deployer.cleanup()
         else:
-            success = deployer.deploy_all()
+            success = asyncio.run(deployer.deploy_all())
 
         sys.exit(0 if success else 1)
 
+    except KeyboardInterrupt:
+        print(f"{Colors.YELLOW}[WARNING]{Colors.END} Interrupted")
+        sys.exit(130)
     except Exception as e:
         print(f"{Colors.RED}[ERROR]{Colors.END} {e}")
         sys.exit(1)